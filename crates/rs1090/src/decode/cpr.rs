@@ -520,31 +520,40 @@ pub fn decode_position(
 pub fn decode_positions(res: &mut [TimedMessage], reference: Option<Position>) {
     let mut aircraft: BTreeMap<ICAO, AircraftState> = BTreeMap::new();
     let mut reference = reference;
+    update_positions(res, &mut aircraft, &mut reference);
+}
 
-    let _: Vec<()> = res
-        .iter_mut()
-        .map(|msg| {
-            if let Some(message) = &mut msg.message {
-                match &mut message.df {
-                    DF::ExtendedSquitterADSB(adsb) => decode_position(
-                        &mut adsb.message,
-                        msg.timestamp,
-                        &adsb.icao24,
-                        &mut aircraft,
-                        &mut reference,
-                    ),
-                    DF::ExtendedSquitterTisB { cf, .. } => decode_position(
-                        &mut cf.me,
-                        msg.timestamp,
-                        &cf.aa,
-                        &mut aircraft,
-                        &mut reference,
-                    ),
-                    _ => {}
-                }
+/**
+ * Decodes the positions in a slice of successive messages, starting from (and
+ * updating) the state of each aircraft, so that a stream of messages can be
+ * decoded in several batches.
+ */
+pub fn update_positions(
+    res: &mut [TimedMessage],
+    aircraft: &mut BTreeMap<ICAO, AircraftState>,
+    reference: &mut Option<Position>,
+) {
+    for msg in res.iter_mut() {
+        if let Some(message) = &mut msg.message {
+            match &mut message.df {
+                DF::ExtendedSquitterADSB(adsb) => decode_position(
+                    &mut adsb.message,
+                    msg.timestamp,
+                    &adsb.icao24,
+                    aircraft,
+                    reference,
+                ),
+                DF::ExtendedSquitterTisB { cf, .. } => decode_position(
+                    &mut cf.me,
+                    msg.timestamp,
+                    &cf.aa,
+                    aircraft,
+                    reference,
+                ),
+                _ => {}
             }
-        })
-        .collect();
+        }
+    }
 }
 
 #[cfg(test)]
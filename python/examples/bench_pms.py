@@ -1,7 +1,148 @@
-from typing import Any
+from typing import Any, Callable
 
 from pyModeS import adsb, bds, commb, py_common
 
+Handler = Callable[[str, int, int, dict[str, Any]], None]
+
+# lookup tables for target state and status messages (tc 29), indexed by
+# the value of the corresponding field
+_TYPES_29 = ("Not Engaged", "Engaged")
+_TCAS_OPERATIONAL_TYPES = ("Not Operational", "Operational")
+_TCAS_RA_TYPES = ("Not active", "Active")
+_EMERGENCY_TYPES = (
+    "No emergency",
+    "General emergency",
+    "Lifeguard/medical emergency",
+    "Minimum fuel",
+    "No communications",
+    "Unlawful interference",
+    "Downed aircraft",
+    "Reserved",
+)
+_VERTICAL_HORIZONTAL_TYPES = {
+    1: "Acquiring mode",
+    2: "Capturing/Maintaining mode",
+}
+
+
+def _callsign(msg: str, n: int, nbits: int, decoded: dict[str, Any]) -> None:
+    callsign = adsb.callsign(msg)
+    decoded["bds"] = 10
+    decoded["callsign"] = callsign
+
+
+def _surface_position(
+    msg: str, n: int, nbits: int, decoded: dict[str, Any]
+) -> None:
+    decoded["bds"] = "06"
+    oe = adsb.oe_flag(msg)
+    cprlat = ((n >> (nbits - 71)) & 0x1FFFF) / 131072.0
+    cprlon = ((n >> (nbits - 88)) & 0x1FFFF) / 131072.0
+    v = adsb.surface_velocity(msg)
+    decoded["oddflag"] = "odd" if oe else "even"
+    decoded["cprlat"] = cprlat
+    decoded["cprlon"] = cprlon
+    decoded["speed"] = v[0]
+    decoded["track"] = v[1]
+
+
+def _airborne_position(
+    msg: str, n: int, nbits: int, decoded: dict[str, Any]
+) -> None:
+    decoded["bds"] = "05"
+    alt = adsb.altitude(msg)
+    oe = adsb.oe_flag(msg)
+    cprlat = ((n >> (nbits - 71)) & 0x1FFFF) / 131072.0
+    cprlon = ((n >> (nbits - 88)) & 0x1FFFF) / 131072.0
+    decoded["oddflag"] = "odd" if oe else "even"
+    decoded["cprlat"] = cprlat
+    decoded["cprlon"] = cprlon
+    decoded["altitude"] = alt
+
+
+def _airborne_velocity(
+    msg: str, n: int, nbits: int, decoded: dict[str, Any]
+) -> None:
+    decoded["bds"] = "09"
+    velocity = adsb.velocity(msg)
+    if velocity is not None:
+        spd, trk, vr, t = velocity
+        types = {"GS": "Ground speed", "TAS": "True airspeed"}
+        decoded[types[t]] = spd
+        decoded["track"] = trk
+        decoded["vertical_rate"] = vr
+
+
+def _target_state_status(
+    msg: str, n: int, nbits: int, decoded: dict[str, Any]
+) -> None:
+    decoded["bds"] = "62"
+    subtype = (n >> (nbits - 39)) & 0x3
+    tcas_operational = adsb.tcas_operational(msg)
+    if subtype == 0:
+        alt, alt_source, alt_ref = adsb.target_altitude(msg)
+        angle, angle_type, angle_source = adsb.target_angle(msg)
+        vertical_mode = adsb.vertical_mode(msg)
+        horizontal_mode = adsb.horizontal_mode(msg)
+        tcas_ra = adsb.tcas_ra(msg)
+        emergency_status = adsb.emergency_status(msg)
+        decoded["target_alt"] = alt
+        decoded["alt_source"] = alt_source
+        decoded["alt_reference"] = alt_ref
+        decoded["angle"] = angle
+        decoded["angle_type"] = angle_type
+        decoded["angle_source"] = angle_source
+        if vertical_mode is not None:
+            decoded["vnav_mode"] = (_VERTICAL_HORIZONTAL_TYPES[vertical_mode],)
+
+        if horizontal_mode is not None:
+            decoded["lnav_mode"] = (
+                _VERTICAL_HORIZONTAL_TYPES[horizontal_mode],
+            )
+        decoded["tcas"] = (
+            _TCAS_OPERATIONAL_TYPES[tcas_operational]
+            if tcas_operational
+            else None,
+        )
+        decoded["tcas_type"] = _TCAS_RA_TYPES[tcas_ra]
+        decoded["emergency_status"] = _EMERGENCY_TYPES[emergency_status]
+    else:
+        alt, alt_source = adsb.selected_altitude(msg)
+        baro = adsb.baro_pressure_setting(msg)
+        hdg = adsb.selected_heading(msg)
+        autopilot = adsb.autopilot(msg)
+        vnav = adsb.vnav_mode(msg)
+        alt_hold = adsb.altitude_hold_mode(msg)
+        app = adsb.approach_mode(msg)
+        lnav = adsb.lnav_mode(msg)
+        decoded["selected_alt"] = alt
+        decoded["alt_source"] = alt_source
+        decoded["barometric_setting"] = baro
+        decoded["selected_hdg"] = hdg
+        if (n >> (nbits - 79)) & 1:
+            decoded["autopilot"] = _TYPES_29[autopilot] if autopilot else None
+            decoded["vnav_mode"] = _TYPES_29[vnav] if vnav else None
+            decoded["alt_hold"] = (_TYPES_29[alt_hold] if alt_hold else None,)
+            decoded["app_mode"] = _TYPES_29[app] if app else None
+            decoded["tcas"] = (
+                _TCAS_OPERATIONAL_TYPES[tcas_operational]
+                if tcas_operational
+                else None,
+            )
+            decoded["lnav_mode"] = _TYPES_29[lnav] if lnav else None
+
+
+# typecode -> handler, built once so that decode does a single lookup
+_TC_HANDLERS: dict[int, Handler] = {}
+for _tc in range(1, 5):
+    _TC_HANDLERS[_tc] = _callsign
+for _tc in range(5, 9):
+    _TC_HANDLERS[_tc] = _surface_position
+for _tc in (*range(9, 19), *range(20, 23)):
+    _TC_HANDLERS[_tc] = _airborne_position
+_TC_HANDLERS[19] = _airborne_velocity
+_TC_HANDLERS[29] = _target_state_status
+
 
 def decode(msg: str, common: Any = py_common) -> dict[str, Any]:
     """rs1090.decode coded in pyModeS
@@ -16,7 +157,11 @@ def decode(msg: str, common: Any = py_common) -> dict[str, Any]:
     df = common.df(msg)
     icao = common.icao(msg)
 
-    decoded = {"msg": msg, "icao": icao, "df": df}
+    # parse the hexadecimal message once, then extract fields with bit masks
+    n = int(msg, 16)
+    nbits = len(msg) * 4
+
+    decoded: dict[str, Any] = {"msg": msg, "icao": icao, "df": df}
 
     if df == 17:
         decoded["tc"] = tc = common.typecode(msg)
@@ -24,136 +169,9 @@ def decode(msg: str, common: Any = py_common) -> dict[str, Any]:
         if tc is None:
             return decoded
 
-        if 1 <= tc <= 4:  # callsign
-            callsign = adsb.callsign(msg)
-            decoded["bds"] = 10
-            decoded["callsign"] = callsign
-
-        if 5 <= tc <= 8:  # surface position
-            decoded["bds"] = "06"
-            oe = adsb.oe_flag(msg)
-            msgbin = common.hex2bin(msg)
-            cprlat = common.bin2int(msgbin[54:71]) / 131072.0
-            cprlon = common.bin2int(msgbin[71:88]) / 131072.0
-            v = adsb.surface_velocity(msg)
-            decoded["oddflag"] = "odd" if oe else "even"
-            decoded["cprlat"] = cprlat
-            decoded["cprlon"] = cprlon
-            decoded["speed"] = v[0]
-            decoded["track"] = v[1]
-
-        if 9 <= tc <= 18:  # airborne position
-            decoded["bds"] = "05"
-            alt = adsb.altitude(msg)
-            oe = adsb.oe_flag(msg)
-            msgbin = common.hex2bin(msg)
-            cprlat = common.bin2int(msgbin[54:71]) / 131072.0
-            cprlon = common.bin2int(msgbin[71:88]) / 131072.0
-            decoded["oddflag"] = "odd" if oe else "even"
-            decoded["cprlat"] = cprlat
-            decoded["cprlon"] = cprlon
-            decoded["altitude"] = alt
-
-        if tc == 19:
-            decoded["bds"] = "09"
-            velocity = adsb.velocity(msg)
-            if velocity is not None:
-                spd, trk, vr, t = velocity
-                types = {"GS": "Ground speed", "TAS": "True airspeed"}
-                decoded[types[t]] = spd
-                decoded["track"] = trk
-                decoded["vertical_rate"] = vr
-
-        if 20 <= tc <= 22:  # airborne position
-            decoded["bds"] = "05"
-            alt = adsb.altitude(msg)
-            oe = adsb.oe_flag(msg)
-            msgbin = common.hex2bin(msg)
-            cprlat = common.bin2int(msgbin[54:71]) / 131072.0
-            cprlon = common.bin2int(msgbin[71:88]) / 131072.0
-            decoded["oddflag"] = "odd" if oe else "even"
-            decoded["cprlat"] = cprlat
-            decoded["cprlon"] = cprlon
-            decoded["altitude"] = alt
-
-        if tc == 29:  # target state and status
-            decoded["bds"] = "62"
-            subtype = common.bin2int((common.hex2bin(msg)[32:])[5:7])
-            tcas_operational = adsb.tcas_operational(msg)
-            types_29 = {0: "Not Engaged", 1: "Engaged"}
-            tcas_operational_types = {0: "Not Operational", 1: "Operational"}
-            if subtype == 0:
-                emergency_types = {
-                    0: "No emergency",
-                    1: "General emergency",
-                    2: "Lifeguard/medical emergency",
-                    3: "Minimum fuel",
-                    4: "No communications",
-                    5: "Unlawful interference",
-                    6: "Downed aircraft",
-                    7: "Reserved",
-                }
-                vertical_horizontal_types = {
-                    1: "Acquiring mode",
-                    2: "Capturing/Maintaining mode",
-                }
-                tcas_ra_types = {0: "Not active", 1: "Active"}
-                alt, alt_source, alt_ref = adsb.target_altitude(msg)
-                angle, angle_type, angle_source = adsb.target_angle(msg)
-                vertical_mode = adsb.vertical_mode(msg)
-                horizontal_mode = adsb.horizontal_mode(msg)
-                tcas_ra = adsb.tcas_ra(msg)
-                emergency_status = adsb.emergency_status(msg)
-                decoded["target_alt"] = alt
-                decoded["alt_source"] = alt_source
-                decoded["alt_reference"] = alt_ref
-                decoded["angle"] = angle
-                decoded["angle_type"] = angle_type
-                decoded["angle_source"] = angle_source
-                if vertical_mode is not None:
-                    decoded["vnav_mode"] = (
-                        vertical_horizontal_types[vertical_mode],
-                    )
-
-                if horizontal_mode is not None:
-                    decoded["lnav_mode"] = (
-                        vertical_horizontal_types[horizontal_mode],
-                    )
-                decoded["tcas"] = (
-                    tcas_operational_types[tcas_operational]
-                    if tcas_operational
-                    else None,
-                )
-                decoded["tcas_type"] = tcas_ra_types[tcas_ra]
-                decoded["emergency_status"] = emergency_types[emergency_status]
-            else:
-                alt, alt_source = adsb.selected_altitude(msg)
-                baro = adsb.baro_pressure_setting(msg)
-                hdg = adsb.selected_heading(msg)
-                autopilot = adsb.autopilot(msg)
-                vnav = adsb.vnav_mode(msg)
-                alt_hold = adsb.altitude_hold_mode(msg)
-                app = adsb.approach_mode(msg)
-                lnav = adsb.lnav_mode(msg)
-                decoded["selected_alt"] = alt
-                decoded["alt_source"] = alt_source
-                decoded["barometric_setting"] = baro
-                decoded["selected_hdg"] = hdg
-                if not (common.bin2int((common.hex2bin(msg)[32:])[46]) == 0):
-                    decoded["autopilot"] = (
-                        types_29[autopilot] if autopilot else None
-                    )
-                    decoded["vnav_mode"] = types_29[vnav] if vnav else None
-                    decoded["alt_hold"] = (
-                        types_29[alt_hold] if alt_hold else None,
-                    )
-                    decoded["app_mode"] = types_29[app] if app else None
-                    decoded["tcas"] = (
-                        tcas_operational_types[tcas_operational]
-                        if tcas_operational
-                        else None,
-                    )
-                    decoded["lnav_mode"] = types_29[lnav] if lnav else None
+        handler = _TC_HANDLERS.get(tc)
+        if handler is not None:
+            handler(msg, n, nbits, decoded)
 
     if df == 20:
         decoded["altitude"] = common.altcode(msg)
@@ -165,7 +183,7 @@ def decode(msg: str, common: Any = py_common) -> dict[str, Any]:
         decoded["bds"] = BDS = bds.infer(msg, mrar=True)
 
         if BDS == "BDS20":
-            decoded["callsign"] = callsign = commb.cs20(msg)
+            decoded["callsign"] = commb.cs20(msg)
 
         if BDS == "BDS40":
             decoded["selected_mcp"] = commb.selalt40mcp(msg)
@@ -187,10 +205,12 @@ def decode(msg: str, common: Any = py_common) -> dict[str, Any]:
             decoded["Vertical rate (INS)"] = commb.vr60ins(msg)
 
         if BDS == "BDS44":
-            decoded["Wind speed"] = commb.wind44(msg)[0]
-            decoded["Wind direction"] = commb.wind44(msg)[1]
-            decoded["Temperature 1"] = commb.temp44(msg)[0]
-            decoded["Temperature 2"] = commb.temp44(msg)[1]
+            wind_speed, wind_direction = commb.wind44(msg)
+            temp1, temp2 = commb.temp44(msg)
+            decoded["Wind speed"] = wind_speed
+            decoded["Wind direction"] = wind_direction
+            decoded["Temperature 1"] = temp1
+            decoded["Temperature 2"] = temp2
             decoded["Pressure"] = commb.p44(msg)
             decoded["Humidity"] = commb.hum44(msg)
             decoded["Turbulence"] = commb.turb44(msg)
@@ -4,23 +4,26 @@ import pandas as pd
 
 from rs1090 import flarm
 
-data = pd.read_csv("../../crates/rs1090/data/flarm.csv")
+data = pd.read_csv(
+    "../../crates/rs1090/data/flarm.csv",
+    engine="pyarrow",
+    dtype_backend="pyarrow",
+)
 
 # %%
 
-decoded = flarm(
+columns = flarm(
     data.rawmessage,
     data.timestamp.astype(int),
     data.sensorlatitude,
     data.sensorlongitude,
+    as_columns=True,
 )
 
 # %%
-from itertools import batched
-
-# 5000 is a good batch size for fast loading!
-df = pd.concat(pd.DataFrame.from_records(d) for d in batched(decoded, 5000))
-df = df.assign(timestamp=pd.to_datetime(df.timestamp, unit="s", utc=True))
+# convert timestamps before building the frame, saving a copy of all columns
+columns["timestamp"] = pd.to_datetime(columns["timestamp"], unit="s", utc=True)
+df = pd.DataFrame(columns)
 df
 
 # %%
@@ -48,21 +51,16 @@ flight = flight.query("distance < 200_000")
 # %%
 import numpy as np
 
-coords = flight[["timestamp", "latitude", "longitude"]]
-delta = pd.concat([coords, coords.add_suffix("_1").diff()], axis=1)
-delta_1 = delta.iloc[1:]
+# Compare each point with the previous one, directly on the numpy arrays
+latitude = flight.latitude.to_numpy()
+longitude = flight.longitude.to_numpy()
 distance_nm = distance(
-    (delta_1.latitude - delta_1.latitude_1).values,
-    (delta_1.longitude - delta_1.longitude_1).values,
-    delta_1.latitude.values,
-    delta_1.longitude.values,
+    latitude[:-1], longitude[:-1], latitude[1:], longitude[1:]
 )
-secs = delta_1.timestamp_1.dt.total_seconds()
+secs = flight.timestamp.diff().dt.total_seconds().to_numpy()[1:]
 
 # Remove irrealistic jumps from a point to another
-flight = flight.assign(
-    gs=list(np.abs(np.pad(distance_nm / secs, (1, 0), "edge")))
-)
+flight = flight.assign(gs=np.abs(np.pad(distance_nm / secs, (1, 0), "edge")))
 
 
 # %%
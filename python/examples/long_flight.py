@@ -4,25 +4,26 @@ import pandas as pd
 
 from rs1090 import decode
 
+# Arrow-backed columns: the CSV is parsed by pyarrow, .str[18:] runs in Arrow
+# compute and decode() reads the string buffers without any Python object
 data = pd.read_csv(
     "../../crates/rs1090/data/long_flight.csv",
     names=["timestamp", "rawmsg"],
+    engine="pyarrow",
+    dtype_backend="pyarrow",
 )
 
 # %%
-decoded = decode(data.rawmsg.str[18:], data.timestamp, reference=(43.3, 1.35))
-
-# %%
-df = pd.DataFrame.from_records(decoded)
-df = df.assign(timestamp=pd.to_datetime(df.timestamp, unit="s", utc=True))
-df
-
-# %%
-from itertools import batched
-
-# 5000 is quite fastest actually!
-df = pd.concat(pd.DataFrame.from_records(d) for d in batched(decoded, 5000))
-df = df.assign(timestamp=pd.to_datetime(df.timestamp, unit="s", utc=True))
+# Fields are gathered into columns on the Rust side: convert timestamps
+# before building the frame, saving a copy of all columns
+columns = decode(
+    data.rawmsg.str[18:],
+    data.timestamp,
+    reference=(43.3, 1.35),
+    as_columns=True,
+)
+columns["timestamp"] = pd.to_datetime(columns["timestamp"], unit="s", utc=True)
+df = pd.DataFrame(columns)
 df
 
 # %%
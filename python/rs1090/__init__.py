@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import os
 import pickle
-from typing import Iterable, Sequence, TypeVar, overload
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
 import pandas as pd
 
+from ._rust import Decoder as _Decoder
 from ._rust import (
     aircraft_information,
     decode_1090,
+    decode_1090_arrow,
     decode_1090_vec,
+    decode_1090t_arrow,
     decode_1090t_vec,
     decode_flarm,
     decode_flarm_vec,
@@ -42,15 +54,15 @@ from .stubs import (
     is_df21,
 )
 
+T = TypeVar("T")
+
 try:
     # new in Python 3.12
     from itertools import batched  # type: ignore
 except ImportError:
     from itertools import islice
 
-    T = TypeVar("T")
-
-    def batched(iterable: Sequence[T], n: int) -> Iterable[tuple[T, ...]]:  # type: ignore
+    def batched(iterable: Iterable[T], n: int) -> Iterable[tuple[T, ...]]:  # type: ignore
         # batched('ABCDEFG', 3) --> ABC DEF G
         if n < 1:
             raise ValueError("n must be at least one")
@@ -59,11 +71,75 @@ except ImportError:
             yield batch
 
 
+def _tolist(values: Sequence[T] | pd.Series) -> Sequence[T]:
+    # The Rust bindings accept lists and tuples; pandas and numpy provide a
+    # fast conversion to list, other iterables are materialised.
+    if isinstance(values, (list, tuple)):
+        return values
+    if hasattr(values, "tolist"):
+        return values.tolist()  # type: ignore
+    return list(values)
+
+
+def _arrow_buffers(msg: pd.Series) -> None | tuple[memoryview, memoryview]:
+    # Arrow-backed string Series expose their offsets and data buffers, which
+    # the Rust bindings read directly instead of creating one str per message.
+    dtype = msg.dtype
+    if not isinstance(dtype, pd.ArrowDtype) and not (
+        isinstance(dtype, pd.StringDtype) and dtype.storage != "python"
+    ):
+        return None
+
+    import pyarrow as pa
+
+    chunked = msg.array.__arrow_array__()
+    if chunked.num_chunks == 0 or chunked.null_count > 0:
+        return None
+    array = (
+        chunked.combine_chunks() if chunked.num_chunks > 1 else chunked.chunk(0)
+    )
+    _, buffer, data = array.buffers()
+    if pa.types.is_string(array.type):
+        offsets = memoryview(buffer).cast("i")
+    elif pa.types.is_large_string(array.type):
+        offsets = memoryview(buffer).cast("q")
+    else:
+        return None
+
+    start, stop = array.offset, array.offset + len(array) + 1
+    return offsets[start:stop], memoryview(data).cast("B")
+
+
+def _decode_batch(
+    msg: list[str] | list[bytes] | pd.Series,
+    timestamp: None | Sequence[float] | pd.Series,
+    reference: None | tuple[float, float],
+    batch: int,
+    columns: bool,
+) -> bytes:
+    # lengths are checked and batches are split on the Rust side
+    buffers = _arrow_buffers(msg) if isinstance(msg, pd.Series) else None
+    if buffers is not None:
+        if timestamp is None:
+            return decode_1090_arrow(*buffers, batch, columns)
+        return decode_1090t_arrow(
+            *buffers, _tolist(timestamp), batch, reference, columns
+        )
+    if timestamp is None:
+        return decode_1090_vec(_tolist(msg), batch, columns)
+    return decode_1090t_vec(
+        _tolist(msg), _tolist(timestamp), batch, reference, columns
+    )
+
+
 __all__ = [
+    "Decoder",
     "Flarm",
     "Message",
     "batched",
     "decode",
+    "decode_dataframe",
+    "decode_iter",
     "flarm",
     "is_bds05",
     "is_bds06",
@@ -95,7 +171,7 @@ __all__ = [
 
 @overload
 def decode(  # type: ignore
-    msg: str,
+    msg: str | bytes,
     timestamp: None | float = None,
     *,
     reference: None | tuple[float, float] = None,
@@ -104,22 +180,36 @@ def decode(  # type: ignore
 
 @overload
 def decode(
-    msg: list[str] | pd.Series,
+    msg: list[str] | list[bytes] | pd.Series,
     timestamp: None | Sequence[float] | pd.Series = None,
     *,
     reference: None | tuple[float, float] = None,
     batch: int = 1000,
+    as_columns: Literal[False] = False,
 ) -> list[Message]: ...
 
 
+@overload
+def decode(
+    msg: list[str] | list[bytes] | pd.Series,
+    timestamp: None | Sequence[float] | pd.Series = None,
+    *,
+    reference: None | tuple[float, float] = None,
+    batch: int = 1000,
+    as_columns: Literal[True],
+) -> dict[str, list[Any]]: ...
+
+
 def decode(
-    msg: str | list[str] | pd.Series,
+    msg: str | bytes | list[str] | list[bytes] | pd.Series,
     timestamp: None | float | Sequence[float] | pd.Series = None,
     *,
     reference: None | tuple[float, float] = None,
     batch: int = 1000,
-) -> Message | list[Message]:
-    if isinstance(msg, str):
+    as_columns: bool = False,
+) -> Message | list[Message] | dict[str, list[Any]]:
+    # messages are either hex-encoded (str) or binary (bytes) frames
+    if isinstance(msg, (str, bytes)):
         payload = decode_1090(msg)
 
     else:
@@ -127,22 +217,85 @@ def decode(
             raise ValueError(
                 "`timestamp` parameter must be a sequence of float"
             )
-        if timestamp is not None and len(timestamp) != len(msg):
-            raise ValueError("`msg` and `timestamp` must be of the same length")
+        # with as_columns, fields are gathered into one list per field on
+        # the Rust side, padded with None where a message does not have it
+        payload = _decode_batch(msg, timestamp, reference, batch, as_columns)
+
+    return pickle.loads(payload)  # type: ignore
 
-        batches = list(batched(msg, batch))
-        if timestamp is None:
-            payload = decode_1090_vec(batches)
-        else:
-            ts = list(batched(timestamp, batch))
-            payload = decode_1090t_vec(batches, ts, reference)
 
-    return pickle.loads(bytes(payload))  # type: ignore
+def decode_dataframe(
+    msg: list[str] | list[bytes] | pd.Series,
+    timestamp: None | Sequence[float] | pd.Series = None,
+    *,
+    reference: None | tuple[float, float] = None,
+    batch: int = 1000,
+) -> pd.DataFrame:
+    # one row per message (with timestamps, messages which could not be
+    # decoded are dropped)
+    columns = decode(
+        msg, timestamp, reference=reference, batch=batch, as_columns=True
+    )
+    return pd.DataFrame(columns)
+
+
+def decode_iter(
+    msg: Iterable[str] | Iterable[bytes],
+    *,
+    batch: int = 1000,
+) -> Iterator[Message | None]:
+    # messages are decoded one batch at a time as the iterable is consumed,
+    # so that only one batch of decoded messages is kept in memory; each
+    # batch is split again so that it is decoded on all cores
+    chunk_size = max(1, batch // (os.cpu_count() or 1))
+    for chunk in batched(msg, batch):
+        yield from pickle.loads(decode_1090_vec(chunk, chunk_size, False))
+
+
+class Decoder:
+    # Decodes a stream of timestamped messages in successive batches: the
+    # state of position decoding (latest position of each aircraft) is kept
+    # from one call to the next.
+    def __init__(self, reference: None | tuple[float, float] = None) -> None:
+        self._decoder = _Decoder(reference)
+
+    @overload
+    def decode(
+        self,
+        msg: list[str] | list[bytes] | pd.Series,
+        timestamp: Sequence[float] | pd.Series,
+        *,
+        batch: int = 1000,
+        as_columns: Literal[False] = False,
+    ) -> list[Message]: ...
+
+    @overload
+    def decode(
+        self,
+        msg: list[str] | list[bytes] | pd.Series,
+        timestamp: Sequence[float] | pd.Series,
+        *,
+        batch: int = 1000,
+        as_columns: Literal[True],
+    ) -> dict[str, list[Any]]: ...
+
+    def decode(
+        self,
+        msg: list[str] | list[bytes] | pd.Series,
+        timestamp: Sequence[float] | pd.Series,
+        *,
+        batch: int = 1000,
+        as_columns: bool = False,
+    ) -> list[Message] | dict[str, list[Any]]:
+        payload = self._decoder.decode(
+            _tolist(msg), _tolist(timestamp), batch, as_columns
+        )
+        return pickle.loads(payload)  # type: ignore
 
 
 @overload
 def flarm(
-    msg: str,
+    msg: str | bytes,
     timestamp: int,
     reference_latitude: float,
     reference_longitude: float,
@@ -153,24 +306,38 @@ def flarm(
 
 @overload
 def flarm(
-    msg: Sequence[str],
+    msg: Sequence[str] | Sequence[bytes],
     timestamp: Sequence[int],
     reference_latitude: Sequence[float],
     reference_longitude: Sequence[float],
     *,
     batch: int = 1000,
+    as_columns: Literal[False] = False,
 ) -> list[Flarm]: ...
 
 
+@overload
+def flarm(
+    msg: Sequence[str] | Sequence[bytes],
+    timestamp: Sequence[int],
+    reference_latitude: Sequence[float],
+    reference_longitude: Sequence[float],
+    *,
+    batch: int = 1000,
+    as_columns: Literal[True],
+) -> dict[str, list[Any]]: ...
+
+
 def flarm(
-    msg: str | Sequence[str],
+    msg: str | bytes | Sequence[str] | Sequence[bytes],
     timestamp: int | Sequence[int],
     reference_latitude: float | Sequence[float],
     reference_longitude: float | Sequence[float],
     *,
     batch: int = 1000,
-) -> Flarm | list[Flarm]:
-    if isinstance(msg, str):
+    as_columns: bool = False,
+) -> Flarm | list[Flarm] | dict[str, list[Any]]:
+    if isinstance(msg, (str, bytes)):
         assert isinstance(timestamp, (int, float))
         assert isinstance(reference_latitude, (int, float))
         assert isinstance(reference_longitude, (int, float))
@@ -181,15 +348,17 @@ def flarm(
             reference_longitude,
         )
     else:
-        batches = list(batched(msg, batch))
         assert not isinstance(timestamp, (int, float))
         assert not isinstance(reference_latitude, (int, float))
         assert not isinstance(reference_longitude, (int, float))
 
-        t = list(batched(timestamp, batch))
-        reflat = list(batched(reference_latitude, batch))
-        reflon = list(batched(reference_longitude, batch))
-
-        payload = decode_flarm_vec(batches, t, reflat, reflon)
+        payload = decode_flarm_vec(
+            _tolist(msg),
+            _tolist(timestamp),
+            _tolist(reference_latitude),
+            _tolist(reference_longitude),
+            batch,
+            as_columns,
+        )
 
-    return pickle.loads(bytes(payload))  # type: ignore
+    return pickle.loads(payload)  # type: ignore
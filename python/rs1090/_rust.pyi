@@ -3,19 +3,49 @@ from typing import Sequence
 def aircraft_information(
     icao24: str, registration: None | str = None
 ) -> dict[str, str]: ...
-def decode_1090(msg: str) -> list[int]: ...
-def decode_1090_vec(msgs: Sequence[Sequence[str]]) -> list[int]: ...
+def decode_1090(msg: str | bytes) -> bytes: ...
+def decode_1090_vec(
+    msgs: Sequence[str] | Sequence[bytes], batch: int, columns: bool
+) -> bytes: ...
 def decode_1090t_vec(
-    msgs: Sequence[Sequence[str]],
-    ts: Sequence[Sequence[float]],
-    reference: None | tuple[float, float] = None,
-) -> list[int]: ...
+    msgs: Sequence[str] | Sequence[bytes],
+    ts: Sequence[float],
+    batch: int,
+    reference: None | tuple[float, float],
+    columns: bool,
+) -> bytes: ...
+def decode_1090_arrow(
+    offsets: memoryview, data: memoryview, batch: int, columns: bool
+) -> bytes: ...
+def decode_1090t_arrow(
+    offsets: memoryview,
+    data: memoryview,
+    ts: Sequence[float],
+    batch: int,
+    reference: None | tuple[float, float],
+    columns: bool,
+) -> bytes: ...
+
+class Decoder:
+    def __init__(
+        self, reference: None | tuple[float, float] = None
+    ) -> None: ...
+    def decode(
+        self,
+        msgs: Sequence[str] | Sequence[bytes],
+        ts: Sequence[float],
+        batch: int,
+        columns: bool,
+    ) -> bytes: ...
+
 def decode_flarm(
-    msg: str, timestamp: int, reflat: float, reflon: float
-) -> list[int]: ...
+    msg: str | bytes, timestamp: int, reflat: float, reflon: float
+) -> bytes: ...
 def decode_flarm_vec(
-    msgs: Sequence[Sequence[str]],
-    ts: Sequence[Sequence[int]],
-    reflat: Sequence[Sequence[float]],
-    reflon: Sequence[Sequence[float]],
-) -> list[int]: ...
+    msgs: Sequence[str] | Sequence[bytes],
+    ts: Sequence[int],
+    reflat: Sequence[float],
+    reflon: Sequence[float],
+    batch: int,
+    columns: bool,
+) -> bytes: ...
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
+import sys
 from typing import Literal, TypedDict, Union, overload
 
-from typing_extensions import (
-    NotRequired,  # python <3.11
-    TypeGuard,  # python <3.10
-)
+if sys.version_info >= (3, 11):
+    from typing import NotRequired, TypeGuard
+elif sys.version_info >= (3, 10):
+    from typing import TypeGuard
+
+    from typing_extensions import NotRequired
+else:
+    from typing_extensions import NotRequired, TypeGuard
+
+
+WakeVortex = Literal[
+    "n/a",
+    "Surface emergency vehicle",
+    "Surface service vehicle",
+    "Obstruction",
+    "Glider",
+    "Lighter than air",
+    "Parachutist",
+    "Ultralight",
+    "UAM",
+    "Space",
+    "<7000kg",
+    "34,000kg",
+    "<136,000kg",
+    "High vortex",
+    "Heavy",
+    "High performance",
+    "Rotorcraft",
+]
+
+TISB = Literal[
+    "ADSB_ES_NT",
+    "ADSB_ES_NT_ALT",
+    "TISB_FINE",
+    "TISB_COARSE",
+    "TISB_MANAGE",
+    "TISB_ADSB_RELAY",
+    "TISB_ADSB",
+    "Reserved",
+]
+
+Turbulence = Literal[None, "Nil", "Light", "Moderate", "Severe"]
 
 
 class DF0(TypedDict):
@@ -82,25 +121,7 @@ class DF17_BDS08(TypedDict):
     df: Literal["17"]
     icao24: str
     bds: Literal["08"]
-    wake_vortex: Literal[
-        "n/a",
-        "Surface emergency vehicle",
-        "Surface service vehicle",
-        "Obstruction",
-        "Glider",
-        "Lighter than air",
-        "Parachutist",
-        "Ultralight",
-        "UAM",
-        "Space",
-        "<7000kg",
-        "34,000kg",
-        "<136,000kg",
-        "High vortex",
-        "Heavy",
-        "High performance",
-        "Rotorcraft",
-    ]
+    wake_vortex: WakeVortex
     callsign: str
 
 
@@ -194,16 +215,7 @@ class DF17_Unknown(TypedDict):
 class DF18_BDS06(TypedDict):
     timestamp: float
     df: Literal["18"]
-    tisb: Literal[
-        "ADSB_ES_NT",
-        "ADSB_ES_NT_ALT",
-        "TISB_FINE",
-        "TISB_COARSE",
-        "TISB_MANAGE",
-        "TISB_ADSB_RELAY",
-        "TISB_ADSB",
-        "Reserved",
-    ]
+    tisb: TISB
     icao24: str
     bds: Literal["06"]
     NUCp: int
@@ -219,53 +231,17 @@ class DF18_BDS06(TypedDict):
 class DF18_BDS08(TypedDict):
     timestamp: float
     df: Literal["18"]
-    tisb: Literal[
-        "ADSB_ES_NT",
-        "ADSB_ES_NT_ALT",
-        "TISB_FINE",
-        "TISB_COARSE",
-        "TISB_MANAGE",
-        "TISB_ADSB_RELAY",
-        "TISB_ADSB",
-        "Reserved",
-    ]
+    tisb: TISB
     icao24: str
     bds: Literal["08"]
-    wake_vortex: Literal[
-        "n/a",
-        "Surface emergency vehicle",
-        "Surface service vehicle",
-        "Obstruction",
-        "Glider",
-        "Lighter than air",
-        "Parachutist",
-        "Ultralight",
-        "UAM",
-        "Space",
-        "<7000kg",
-        "34,000kg",
-        "<136,000kg",
-        "High vortex",
-        "Heavy",
-        "High performance",
-        "Rotorcraft",
-    ]
+    wake_vortex: WakeVortex
     callsign: str
 
 
 class DF18_BDS65(TypedDict):
     timestamp: float
     df: Literal["18"]
-    tisb: Literal[
-        "ADSB_ES_NT",
-        "ADSB_ES_NT_ALT",
-        "TISB_FINE",
-        "TISB_COARSE",
-        "TISB_MANAGE",
-        "TISB_ADSB_RELAY",
-        "TISB_ADSB",
-        "Reserved",
-    ]
+    tisb: TISB
     icao24: str
     bds: Literal["65"]
     version: Literal["1", "2"]
@@ -293,16 +269,7 @@ class DF18_BDS65(TypedDict):
 class DF18_Unknown(TypedDict):
     timestamp: float
     df: Literal["18"]
-    tisb: Literal[
-        "ADSB_ES_NT",
-        "ADSB_ES_NT_ALT",
-        "TISB_FINE",
-        "TISB_COARSE",
-        "TISB_MANAGE",
-        "TISB_ADSB_RELAY",
-        "TISB_ADSB",
-        "Reserved",
-    ]
+    tisb: TISB
     icao24: str
     bds: Literal["?"]
 
@@ -419,7 +386,7 @@ class DF20_BDS44(TypedDict):
     wind_direction: None | float
     temperature: float
     pressure: None | int
-    turbulence: Literal[None, "Nil", "Light", "Moderate", "Severe"]
+    turbulence: Turbulence
     humidity: None | float
     icao24: str
 
@@ -570,7 +537,7 @@ class DF21_BDS44(TypedDict):
     wind_direction: None | float
     temperature: float
     pressure: None | int
-    turbulence: Literal[None, "Nil", "Light", "Moderate", "Severe"]
+    turbulence: Turbulence
     humidity: None | float
     icao24: str
 
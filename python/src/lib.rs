@@ -1,36 +1,211 @@
 #![allow(rustdoc::missing_crate_level_docs)]
 
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
+use std::ops::Deref;
 
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use rayon::prelude::*;
 use regex::Regex;
 use rs1090::data::patterns::PATTERNS;
 use rs1090::data::tail::tail;
-use rs1090::decode::cpr::{decode_positions, Position};
+use rs1090::decode::cpr::{
+    decode_positions, update_positions, AircraftState, Position,
+};
 use rs1090::decode::flarm::Flarm;
 use rs1090::decode::TimeSource;
 use rs1090::prelude::*;
+use serde::ser::{
+    Error as _, Impossible, Serialize, SerializeMap, SerializeStruct,
+    Serializer,
+};
+use serde_pickle::{Error, Value};
+
+/// A raw message, either hex-encoded (str) or already in binary form (bytes)
+#[derive(FromPyObject)]
+enum Frame<'a> {
+    Hex(&'a str),
+    Bin(&'a [u8]),
+}
+
+/// Mode S frames are 7 or 14 bytes long, FLARM frames 26 bytes long
+const FRAME_BUFFER: usize = 32;
+
+/// Value of each ASCII hexadecimal digit, 0xff for any other byte
+const HEX_DIGITS: [u8; 256] = {
+    let mut table = [0xff; 256];
+    let mut i = 0;
+    while i < 10 {
+        table[b'0' as usize + i] = i as u8;
+        i += 1;
+    }
+    let mut i = 0;
+    while i < 6 {
+        table[b'a' as usize + i] = 10 + i as u8;
+        table[b'A' as usize + i] = 10 + i as u8;
+        i += 1;
+    }
+    table
+};
+
+/// Decode a hex-encoded frame with one table lookup per digit
+fn decode_hex(msg: &[u8], out: &mut [u8]) -> Result<(), hex::FromHexError> {
+    if msg.len() % 2 != 0 {
+        return Err(hex::FromHexError::OddLength);
+    }
+    for (i, (byte, pair)) in out.iter_mut().zip(msg.chunks_exact(2)).enumerate()
+    {
+        let high = HEX_DIGITS[pair[0] as usize];
+        let low = HEX_DIGITS[pair[1] as usize];
+        if (high | low) > 0xf {
+            let index = 2 * i + usize::from(high <= 0xf);
+            let c = msg[index] as char;
+            return Err(hex::FromHexError::InvalidHexCharacter { c, index });
+        }
+        *byte = (high << 4) | low;
+    }
+    Ok(())
+}
+
+/// A frame in binary form: hex-encoded frames are decoded into a buffer on
+/// the stack rather than into a new Vec for each message
+enum FrameBytes<'a> {
+    Stack([u8; FRAME_BUFFER], usize),
+    Heap(Vec<u8>),
+    Borrowed(&'a [u8]),
+}
+
+impl Deref for FrameBytes<'_> {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        match self {
+            FrameBytes::Stack(buffer, len) => &buffer[..*len],
+            FrameBytes::Heap(bytes) => bytes,
+            FrameBytes::Borrowed(bytes) => bytes,
+        }
+    }
+}
+
+impl Frame<'_> {
+    fn to_bytes(&self) -> FrameBytes<'_> {
+        match self {
+            Frame::Hex(msg) if msg.len() <= 2 * FRAME_BUFFER => {
+                let mut buffer = [0; FRAME_BUFFER];
+                let len = msg.len() / 2;
+                decode_hex(msg.as_bytes(), &mut buffer[..len]).unwrap();
+                FrameBytes::Stack(buffer, len)
+            }
+            Frame::Hex(msg) => FrameBytes::Heap(hex::decode(msg).unwrap()),
+            Frame::Bin(msg) => FrameBytes::Borrowed(msg),
+        }
+    }
+
+    fn to_hex(&self) -> String {
+        match self {
+            Frame::Hex(msg) => msg.to_string(),
+            Frame::Bin(msg) => hex::encode(msg),
+        }
+    }
+}
 
 #[pyfunction]
-fn decode_1090(msg: String) -> PyResult<Vec<u8>> {
-    let bytes = hex::decode(msg).unwrap();
+fn decode_1090<'py>(
+    py: Python<'py>,
+    msg: Frame,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let bytes = msg.to_bytes();
     if let Ok((_, msg)) = Message::from_bytes((&bytes, 0)) {
         let pkl = serde_pickle::to_vec(&msg, Default::default()).unwrap();
-        Ok(pkl)
+        Ok(PyBytes::new_bound(py, &pkl))
     } else {
-        Ok([128, 4, 78, 46].to_vec()) // None
+        Ok(PyBytes::new_bound(py, &[128, 4, 78, 46])) // None
     }
 }
 
-#[pyfunction]
-fn decode_1090_vec(msgs_set: Vec<Vec<String>>) -> PyResult<Vec<u8>> {
-    let res: Vec<Option<Message>> = msgs_set
-        .par_iter()
+/// Batch sizes are taken as signed integers, so that negative values raise
+/// a ValueError rather than an OverflowError
+fn check_batch(batch: isize) -> PyResult<usize> {
+    if batch < 1 {
+        return Err(PyValueError::new_err("batch must be at least one"));
+    }
+    Ok(batch as usize)
+}
+
+fn check_length(msgs: usize, other: usize, name: &str) -> PyResult<()> {
+    if msgs != other {
+        return Err(PyValueError::new_err(format!(
+            "`msg` and `{name}` must be of the same length"
+        )));
+    }
+    Ok(())
+}
+
+/// Offsets of an Arrow string (int32) or large_string (int64) array
+#[derive(FromPyObject)]
+enum Offsets {
+    Small(PyBuffer<i32>),
+    Large(PyBuffer<i64>),
+}
+
+impl Offsets {
+    fn to_vec(&self) -> PyResult<Vec<usize>> {
+        match self {
+            Offsets::Small(buffer) => {
+                Ok(as_slice(buffer)?.iter().map(|&o| o as usize).collect())
+            }
+            Offsets::Large(buffer) => {
+                Ok(as_slice(buffer)?.iter().map(|&o| o as usize).collect())
+            }
+        }
+    }
+}
+
+fn as_slice<T: Element>(buffer: &PyBuffer<T>) -> PyResult<&[T]> {
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err("buffer must be contiguous"));
+    }
+    if buffer.item_count() == 0 {
+        return Ok(&[]);
+    }
+    // SAFETY: the buffer is contiguous, its format matches T (checked when
+    // the PyBuffer was extracted) and it is kept alive by `buffer`.
+    Ok(unsafe {
+        std::slice::from_raw_parts(
+            buffer.buf_ptr() as *const T,
+            buffer.item_count(),
+        )
+    })
+}
+
+/// Borrow the messages of an Arrow string array, without a Python object
+/// per message
+fn arrow_frames<'a>(
+    offsets: &Offsets,
+    data: &'a [u8],
+) -> PyResult<Vec<Frame<'a>>> {
+    offsets
+        .to_vec()?
+        .windows(2)
+        .map(|w| {
+            let msg = data.get(w[0]..w[1]).ok_or_else(|| {
+                PyValueError::new_err("offsets out of the data buffer")
+            })?;
+            let msg = std::str::from_utf8(msg)
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            Ok(Frame::Hex(msg))
+        })
+        .collect()
+}
+
+fn decode_frames(msgs: &[Frame], batch: usize) -> Vec<Option<Message>> {
+    msgs.par_chunks(batch)
         .map(|msgs| {
             msgs.iter()
                 .map(|msg| {
-                    let bytes = hex::decode(msg).unwrap();
+                    let bytes = msg.to_bytes();
                     if let Ok((_, msg)) = Message::from_bytes((&bytes, 0)) {
                         Some(msg)
                     } else {
@@ -40,30 +215,28 @@ fn decode_1090_vec(msgs_set: Vec<Vec<String>>) -> PyResult<Vec<u8>> {
                 .collect()
         })
         .flat_map(|v: Vec<Option<Message>>| v)
-        .collect();
-    let pkl = serde_pickle::to_vec(&res, Default::default()).unwrap();
-    Ok(pkl)
+        .collect()
 }
 
-#[pyfunction]
-fn decode_1090t_vec(
-    msgs_set: Vec<Vec<String>>,
-    ts_set: Vec<Vec<f64>>,
+fn decode_timed_frames(
+    msgs: &[Frame],
+    ts: &[f64],
+    batch: usize,
     reference: Option<[f64; 2]>,
-) -> PyResult<Vec<u8>> {
-    let mut res: Vec<TimedMessage> = msgs_set
-        .par_iter()
-        .zip(ts_set)
+) -> Vec<TimedMessage> {
+    let mut res: Vec<TimedMessage> = msgs
+        .par_chunks(batch)
+        .zip(ts.par_chunks(batch))
         .map(|(msgs, ts)| {
             msgs.iter()
                 .zip(ts)
                 .filter_map(|(msg, timestamp)| {
-                    let bytes = hex::decode(msg).unwrap();
+                    let bytes = msg.to_bytes();
                     if let Ok((_, message)) = Message::from_bytes((&bytes, 0)) {
                         Some(TimedMessage {
-                            timestamp,
+                            timestamp: *timestamp,
                             timesource: TimeSource::External,
-                            frame: msg.to_string(),
+                            frame: msg.to_hex(),
                             message: Some(message),
                             idx: 0,
                         })
@@ -84,56 +257,379 @@ fn decode_1090t_vec(
         decode_positions(&mut res, position);
     }
 
-    let pkl = serde_pickle::to_vec(&res, Default::default()).unwrap();
-    Ok(pkl)
+    res
+}
+
+/// Decoded messages laid out as one list per field, in the order fields
+/// first appear, so that pandas builds a DataFrame without going through
+/// one dict per message
+struct Columns {
+    names: Vec<String>,
+    values: Vec<Vec<Value>>,
+}
+
+impl Columns {
+    fn new<T: Serialize + Sync>(rows: &[T]) -> Result<Self, Error> {
+        let rows: Vec<Option<Fields>> = rows
+            .par_iter()
+            .map(|row| row.serialize(FieldSerializer))
+            .collect::<Result<_, _>>()?;
+        let size = rows.len();
+        let mut index: HashMap<String, usize> = HashMap::new();
+        let mut columns = Columns {
+            names: Vec::new(),
+            values: Vec::new(),
+        };
+        for (i, row) in rows.into_iter().enumerate() {
+            // undecoded messages (None) leave a null in every column
+            let Some(fields) = row else { continue };
+            for (key, value) in fields {
+                let j = *index.entry(key).or_insert_with_key(|key| {
+                    columns.names.push(key.clone());
+                    columns.values.push(Vec::with_capacity(size));
+                    columns.names.len() - 1
+                });
+                let column = &mut columns.values[j];
+                column.resize(i, Value::None); // pad sparse fields
+                column.push(value);
+            }
+        }
+        for column in columns.values.iter_mut() {
+            column.resize(size, Value::None);
+        }
+        Ok(columns)
+    }
+}
+
+/// Fields of a decoded message, in serialization order
+type Fields = Vec<(String, Value)>;
+
+/// Serializes a message into its fields, keeping their order: going
+/// through `serde_pickle::to_value` would sort them as a `BTreeMap`
+struct FieldSerializer;
+
+macro_rules! not_a_map {
+    ($($method:ident($($arg:ty),*) -> $ret:ty;)*) => {
+        $(fn $method(self, $(_: $arg),*) -> Result<$ret, Error> {
+            Err(Error::custom("decoded messages must serialize as maps"))
+        })*
+    };
+}
+
+impl Serializer for FieldSerializer {
+    type Ok = Option<Fields>;
+    type Error = Error;
+    type SerializeSeq = Impossible<Self::Ok, Error>;
+    type SerializeTuple = Impossible<Self::Ok, Error>;
+    type SerializeTupleStruct = Impossible<Self::Ok, Error>;
+    type SerializeTupleVariant = Impossible<Self::Ok, Error>;
+    type SerializeMap = FieldCollector;
+    type SerializeStruct = FieldCollector;
+    type SerializeStructVariant = Impossible<Self::Ok, Error>;
+
+    fn serialize_none(self) -> Result<Self::Ok, Error> {
+        Ok(None)
+    }
+
+    fn serialize_some<V: ?Sized + Serialize>(
+        self,
+        value: &V,
+    ) -> Result<Self::Ok, Error> {
+        value.serialize(self)
+    }
+
+    fn serialize_map(
+        self,
+        len: Option<usize>,
+    ) -> Result<FieldCollector, Error> {
+        Ok(FieldCollector {
+            fields: Vec::with_capacity(len.unwrap_or(0)),
+            key: None,
+        })
+    }
+
+    fn serialize_struct(
+        self,
+        _name: &'static str,
+        len: usize,
+    ) -> Result<FieldCollector, Error> {
+        self.serialize_map(Some(len))
+    }
+
+    fn serialize_newtype_struct<V: ?Sized + Serialize>(
+        self,
+        _name: &'static str,
+        value: &V,
+    ) -> Result<Self::Ok, Error> {
+        value.serialize(self)
+    }
+
+    fn serialize_newtype_variant<V: ?Sized + Serialize>(
+        self,
+        _name: &'static str,
+        _index: u32,
+        _variant: &'static str,
+        _value: &V,
+    ) -> Result<Self::Ok, Error> {
+        Err(Error::custom("decoded messages must serialize as maps"))
+    }
+
+    not_a_map! {
+        serialize_bool(bool) -> Self::Ok;
+        serialize_i8(i8) -> Self::Ok;
+        serialize_i16(i16) -> Self::Ok;
+        serialize_i32(i32) -> Self::Ok;
+        serialize_i64(i64) -> Self::Ok;
+        serialize_u8(u8) -> Self::Ok;
+        serialize_u16(u16) -> Self::Ok;
+        serialize_u32(u32) -> Self::Ok;
+        serialize_u64(u64) -> Self::Ok;
+        serialize_f32(f32) -> Self::Ok;
+        serialize_f64(f64) -> Self::Ok;
+        serialize_char(char) -> Self::Ok;
+        serialize_str(&str) -> Self::Ok;
+        serialize_bytes(&[u8]) -> Self::Ok;
+        serialize_unit() -> Self::Ok;
+        serialize_unit_struct(&'static str) -> Self::Ok;
+        serialize_unit_variant(&'static str, u32, &'static str) -> Self::Ok;
+        serialize_seq(Option<usize>) -> Self::SerializeSeq;
+        serialize_tuple(usize) -> Self::SerializeTuple;
+        serialize_tuple_struct(&'static str, usize) -> Self::SerializeTupleStruct;
+        serialize_tuple_variant(&'static str, u32, &'static str, usize)
+            -> Self::SerializeTupleVariant;
+        serialize_struct_variant(&'static str, u32, &'static str, usize)
+            -> Self::SerializeStructVariant;
+    }
+}
+
+struct FieldCollector {
+    fields: Fields,
+    key: Option<String>,
+}
+
+impl SerializeMap for FieldCollector {
+    type Ok = Option<Fields>;
+    type Error = Error;
+
+    fn serialize_key<K: ?Sized + Serialize>(
+        &mut self,
+        key: &K,
+    ) -> Result<(), Error> {
+        match serde_pickle::to_value(&key)? {
+            Value::String(key) => {
+                self.key = Some(key);
+                Ok(())
+            }
+            _ => Err(Error::custom("field names must be strings")),
+        }
+    }
+
+    fn serialize_value<V: ?Sized + Serialize>(
+        &mut self,
+        value: &V,
+    ) -> Result<(), Error> {
+        let key = self.key.take().expect("serialize_key is called first");
+        self.fields.push((key, serde_pickle::to_value(&value)?));
+        Ok(())
+    }
+
+    fn end(self) -> Result<Self::Ok, Error> {
+        Ok(Some(self.fields))
+    }
+}
+
+impl SerializeStruct for FieldCollector {
+    type Ok = Option<Fields>;
+    type Error = Error;
+
+    fn serialize_field<V: ?Sized + Serialize>(
+        &mut self,
+        key: &'static str,
+        value: &V,
+    ) -> Result<(), Error> {
+        self.fields
+            .push((key.to_string(), serde_pickle::to_value(&value)?));
+        Ok(())
+    }
+
+    fn end(self) -> Result<Self::Ok, Error> {
+        Ok(Some(self.fields))
+    }
+}
+
+impl Serialize for Columns {
+    fn serialize<S: Serializer>(
+        &self,
+        serializer: S,
+    ) -> Result<S::Ok, S::Error> {
+        let mut map = serializer.serialize_map(Some(self.names.len()))?;
+        for (name, values) in self.names.iter().zip(&self.values) {
+            map.serialize_entry(name, values)?;
+        }
+        map.end()
+    }
+}
+
+fn to_pickle<T: Serialize + Sync>(res: &[T], columns: bool) -> Vec<u8> {
+    if columns {
+        let columns = Columns::new(res).unwrap();
+        serde_pickle::to_vec(&columns, Default::default()).unwrap()
+    } else {
+        serde_pickle::to_vec(&res, Default::default()).unwrap()
+    }
 }
 
 #[pyfunction]
-fn decode_flarm(
-    msg: String,
+fn decode_1090_vec<'py>(
+    py: Python<'py>,
+    msgs: Vec<Frame>,
+    batch: isize,
+    columns: bool,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let batch = check_batch(batch)?;
+    let pkl = py.allow_threads(|| {
+        let res = decode_frames(&msgs, batch);
+        to_pickle(&res, columns)
+    });
+    Ok(PyBytes::new_bound(py, &pkl))
+}
+
+#[pyfunction]
+fn decode_1090t_vec<'py>(
+    py: Python<'py>,
+    msgs: Vec<Frame>,
+    ts: Vec<f64>,
+    batch: isize,
+    reference: Option<[f64; 2]>,
+    columns: bool,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let batch = check_batch(batch)?;
+    check_length(msgs.len(), ts.len(), "timestamp")?;
+    let pkl = py.allow_threads(|| {
+        let res = decode_timed_frames(&msgs, &ts, batch, reference);
+        to_pickle(&res, columns)
+    });
+    Ok(PyBytes::new_bound(py, &pkl))
+}
+
+#[pyfunction]
+fn decode_1090_arrow<'py>(
+    py: Python<'py>,
+    offsets: Offsets,
+    data: PyBuffer<u8>,
+    batch: isize,
+    columns: bool,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let batch = check_batch(batch)?;
+    let msgs = arrow_frames(&offsets, as_slice(&data)?)?;
+    let pkl = py.allow_threads(|| {
+        let res = decode_frames(&msgs, batch);
+        to_pickle(&res, columns)
+    });
+    Ok(PyBytes::new_bound(py, &pkl))
+}
+
+#[pyfunction]
+fn decode_1090t_arrow<'py>(
+    py: Python<'py>,
+    offsets: Offsets,
+    data: PyBuffer<u8>,
+    ts: Vec<f64>,
+    batch: isize,
+    reference: Option<[f64; 2]>,
+    columns: bool,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let batch = check_batch(batch)?;
+    let msgs = arrow_frames(&offsets, as_slice(&data)?)?;
+    check_length(msgs.len(), ts.len(), "timestamp")?;
+    let pkl = py.allow_threads(|| {
+        let res = decode_timed_frames(&msgs, &ts, batch, reference);
+        to_pickle(&res, columns)
+    });
+    Ok(PyBytes::new_bound(py, &pkl))
+}
+
+/// Decoder keeping the state of position decoding (latest position of each
+/// aircraft, reference for surface positions) between successive batches
+#[pyclass]
+struct Decoder {
+    aircraft: BTreeMap<ICAO, AircraftState>,
+    reference: Option<Position>,
+}
+
+#[pymethods]
+impl Decoder {
+    #[new]
+    #[pyo3(signature = (reference=None))]
+    fn new(reference: Option<[f64; 2]>) -> Self {
+        Decoder {
+            aircraft: BTreeMap::new(),
+            reference: reference.map(|[latitude, longitude]| Position {
+                latitude,
+                longitude,
+            }),
+        }
+    }
+
+    fn decode<'py>(
+        &mut self,
+        py: Python<'py>,
+        msgs: Vec<Frame>,
+        ts: Vec<f64>,
+        batch: isize,
+        columns: bool,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let batch = check_batch(batch)?;
+        check_length(msgs.len(), ts.len(), "timestamp")?;
+        let aircraft = &mut self.aircraft;
+        let reference = &mut self.reference;
+        let pkl = py.allow_threads(|| {
+            let mut res = decode_timed_frames(&msgs, &ts, batch, None);
+            update_positions(&mut res, aircraft, reference);
+            to_pickle(&res, columns)
+        });
+        Ok(PyBytes::new_bound(py, &pkl))
+    }
+}
+
+#[pyfunction]
+fn decode_flarm<'py>(
+    py: Python<'py>,
+    msg: Frame,
     ts: u32,
     reflat: f64,
     reflon: f64,
-) -> PyResult<Vec<u8>> {
-    let bytes = hex::decode(msg).unwrap();
+) -> PyResult<Bound<'py, PyBytes>> {
+    let bytes = msg.to_bytes();
     let reference = [reflat, reflon];
     if let Ok(msg) = Flarm::from_record(ts, &reference, &bytes) {
         let pkl = serde_pickle::to_vec(&msg, Default::default()).unwrap();
-        Ok(pkl)
+        Ok(PyBytes::new_bound(py, &pkl))
     } else {
-        Ok([128, 4, 78, 46].to_vec()) // None
+        Ok(PyBytes::new_bound(py, &[128, 4, 78, 46])) // None
     }
 }
 
-#[pyfunction]
-fn decode_flarm_vec(
-    msgs_set: Vec<Vec<String>>,
-    ts_set: Vec<Vec<u32>>,
-    ref_lat: Vec<Vec<f64>>,
-    ref_lon: Vec<Vec<f64>>,
-) -> PyResult<Vec<u8>> {
-    let reference: Vec<Vec<[f64; 2]>> = ref_lat
-        .iter()
-        .zip(ref_lon.iter())
-        .map(|(lat, lon)| {
-            lat.iter()
-                .zip(lon.iter())
-                .map(|(lat, lon)| [*lat, *lon])
-                .collect()
-        })
-        .collect();
-    let res: Vec<Flarm> = msgs_set
-        .par_iter()
-        .zip(ts_set)
-        .zip(reference)
-        .map(|((msgs, ts), reference)| {
+fn decode_flarm_frames(
+    msgs: &[Frame],
+    ts: &[u32],
+    ref_lat: &[f64],
+    ref_lon: &[f64],
+    batch: usize,
+) -> Vec<Flarm> {
+    msgs.par_chunks(batch)
+        .zip(ts.par_chunks(batch))
+        .zip(ref_lat.par_chunks(batch))
+        .zip(ref_lon.par_chunks(batch))
+        .map(|(((msgs, ts), ref_lat), ref_lon)| {
             msgs.iter()
                 .zip(ts)
-                .zip(reference)
-                .filter_map(|((msg, timestamp), reference)| {
-                    let bytes = hex::decode(msg).unwrap();
+                .zip(ref_lat.iter().zip(ref_lon))
+                .filter_map(|((msg, timestamp), (lat, lon))| {
+                    let bytes = msg.to_bytes();
+                    let reference = [*lat, *lon];
                     if let Ok(flarm) =
-                        Flarm::from_record(timestamp, &reference, &bytes)
+                        Flarm::from_record(*timestamp, &reference, &bytes)
                     {
                         Some(flarm)
                     } else {
@@ -143,10 +639,28 @@ fn decode_flarm_vec(
                 .collect()
         })
         .flat_map(|v: Vec<Flarm>| v)
-        .collect();
+        .collect()
+}
 
-    let pkl = serde_pickle::to_vec(&res, Default::default()).unwrap();
-    Ok(pkl)
+#[pyfunction]
+fn decode_flarm_vec<'py>(
+    py: Python<'py>,
+    msgs: Vec<Frame>,
+    ts: Vec<u32>,
+    ref_lat: Vec<f64>,
+    ref_lon: Vec<f64>,
+    batch: isize,
+    columns: bool,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let batch = check_batch(batch)?;
+    check_length(msgs.len(), ts.len(), "timestamp")?;
+    check_length(msgs.len(), ref_lat.len(), "reference_latitude")?;
+    check_length(msgs.len(), ref_lon.len(), "reference_longitude")?;
+    let pkl = py.allow_threads(|| {
+        let res = decode_flarm_frames(&msgs, &ts, &ref_lat, &ref_lon, batch);
+        to_pickle(&res, columns)
+    });
+    Ok(PyBytes::new_bound(py, &pkl))
 }
 
 #[pyfunction]
@@ -222,6 +736,9 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(decode_1090, m)?)?;
     m.add_function(wrap_pyfunction!(decode_1090_vec, m)?)?;
     m.add_function(wrap_pyfunction!(decode_1090t_vec, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_1090_arrow, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_1090t_arrow, m)?)?;
+    m.add_class::<Decoder>()?;
     m.add_function(wrap_pyfunction!(decode_flarm, m)?)?;
     m.add_function(wrap_pyfunction!(decode_flarm_vec, m)?)?;
 
@@ -230,3 +747,39 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn decode(msg: &str) -> Result<Vec<u8>, hex::FromHexError> {
+        let mut out = vec![0; msg.len() / 2];
+        decode_hex(msg.as_bytes(), &mut out).map(|_| out)
+    }
+
+    #[test]
+    fn test_decode_hex() {
+        for msg in [
+            "8D406B902015A678D4D220AA4BDA",
+            "8d406b902015a678d4d220aa4bda",
+            "0123456789abcdefABCDEF",
+            "",
+        ] {
+            assert_eq!(decode(msg), hex::decode(msg));
+        }
+    }
+
+    #[test]
+    fn test_decode_hex_errors() {
+        for msg in [
+            "8D406B902015A678D4D220AA4BD",  // odd length
+            "8D406B902015A678D4D220AA4BDx", // invalid low nibble
+            "8D406B902015A678D4D220AA4BxA", // invalid high nibble
+            "8g406B902015A678D4D220AA4BDA",
+            "gg406B902015A678D4D220AA4BDA", // both invalid
+        ] {
+            assert!(decode(msg).is_err());
+            assert_eq!(decode(msg), hex::decode(msg));
+        }
+    }
+}
@@ -1,3 +1,6 @@
+import pandas as pd
+import pytest
+
 import rs1090
 
 
@@ -11,6 +14,59 @@ def test_crc() -> None:
     assert rs1090.decode("8d4065de58a1054a7ef0218e226a")["df"] == "17"
 
 
+def test_bytes() -> None:
+    msg = bytes.fromhex("8D406B902015A678D4D220AA4BDA")
+    assert rs1090.decode(msg)["icao24"] == "406b90"
+    decoded = rs1090.decode(
+        [msg, bytes.fromhex("8d4ca251204994b1c36e60a5343d")]
+    )
+    assert decoded[0]["icao24"] == "406b90"
+    assert decoded[1] is None
+
+
+def test_arrow_series() -> None:
+    pytest.importorskip("pyarrow")
+    msgs = pd.Series(
+        ["8D406B902015A678D4D220AA4BDA", "8d4ca251204994b1c36e60a5343d"],
+        dtype="string[pyarrow]",
+    )
+    decoded = rs1090.decode(msgs)
+    assert decoded[0]["icao24"] == "406b90"
+    assert decoded[1] is None
+
+
+def test_columns() -> None:
+    msgs = [
+        "8D406B902015A678D4D220AA4BDA",
+        "8d4ca251204994b1c36e60a5343d",
+        "A02014B400000000000000F9D514",
+    ]
+    columns = rs1090.decode(msgs, as_columns=True)
+    assert all(len(column) == 3 for column in columns.values())
+    assert columns["df"] == ["17", None, "20"]
+    assert columns["altitude"] == [None, None, 32300]
+
+
+def test_iter() -> None:
+    msgs = ["8D406B902015A678D4D220AA4BDA", "8d4ca251204994b1c36e60a5343d"]
+    decoded = list(rs1090.decode_iter(iter(msgs * 3), batch=4))
+    assert decoded == rs1090.decode(msgs * 3)
+
+
+def test_length_mismatch() -> None:
+    msgs = ["8D406B902015A678D4D220AA4BDA", "8d4ca251204994b1c36e60a5343d"]
+    with pytest.raises(ValueError):
+        rs1090.decode(msgs, [1.0])
+
+
+def test_batch_size() -> None:
+    msgs = ["8D406B902015A678D4D220AA4BDA", "8d4ca251204994b1c36e60a5343d"]
+    with pytest.raises(ValueError):
+        rs1090.decode(msgs, batch=0)
+    with pytest.raises(ValueError):
+        rs1090.decode(msgs, batch=-1)
+
+
 def test_fail_crc() -> None:
     assert rs1090.decode("8d4ca251204994b1c36e60a5343d") is None
 
@@ -29,6 +29,48 @@ def test_flarm() -> None:
     assert decoded["gps"] == 3926
 
 
+def test_columns() -> None:
+    msg = "7bf23810860b7eabb23952252fd4927024b21fd94e9e1ef416f0"
+    columns = flarm(
+        [msg, msg],
+        [1655274034, 1655274034],
+        [43.61924, 43.61924],
+        [5.11755, 5.11755],
+        as_columns=True,
+    )
+    assert columns["icao24"] == ["38f27b", "38f27b"]
+    assert columns["geoaltitude"] == [160, 160]
+
+
+def test_full_columns() -> None:
+    data = pd.read_csv(
+        root.parent.parent.parent / "crates/rs1090/data/flarm.csv",
+    )
+
+    decoded = pd.DataFrame(
+        flarm(
+            data.rawmessage,
+            data.timestamp.astype(int),
+            data.sensorlatitude,
+            data.sensorlongitude,
+            as_columns=True,
+        )
+    )
+
+    assert decoded.latitude.notna().all()
+    assert decoded.longitude.notna().all()
+
+    assert (decoded.latitude > 47).sum() == 0
+    assert (decoded.latitude < 40).sum() == 0
+    assert (decoded.longitude > 12).sum() == 0
+    assert (decoded.longitude < -2).sum() == 0
+
+    assert (
+        decoded.latitude.between(43, 44, inclusive="neither")
+        & decoded.longitude.between(4.5, 5.5, inclusive="neither")
+    ).mean() > 0.95
+
+
 def test_full() -> None:
     data = pd.read_csv(
         root.parent.parent.parent / "crates/rs1090/data/flarm.csv",
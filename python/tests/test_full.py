@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from rs1090 import decode
+from rs1090 import Decoder, decode, decode_dataframe
 
 root = Path(__file__)
 
@@ -20,3 +20,47 @@ def test_full() -> None:
     )
 
     assert data.shape[0] == len(decoded)
+
+
+def test_dataframe() -> None:
+    data = pd.read_csv(
+        root.parent.parent.parent / "crates/rs1090/data/long_flight.csv",
+        names=["timestamp", "rawmsg"],
+    )
+    msgs = data.rawmsg.str[18:]
+
+    decoded = decode(msgs, data.timestamp, reference=(43.3, 1.35))
+    df = decode_dataframe(msgs, data.timestamp, reference=(43.3, 1.35))
+
+    assert df.shape[0] == len(decoded)
+    # columns come in the order fields first appear, as with pd.DataFrame
+    assert list(df.columns) == list(
+        dict.fromkeys(key for msg in decoded for key in msg)
+    )
+    assert df.icao24.tolist() == [msg["icao24"] for msg in decoded]
+    assert df.latitude.notna().sum() == sum(
+        msg.get("latitude") is not None for msg in decoded
+    )
+
+
+def test_decoder() -> None:
+    data = pd.read_csv(
+        root.parent.parent.parent / "crates/rs1090/data/long_flight.csv",
+        names=["timestamp", "rawmsg"],
+    )
+    msgs = data.rawmsg.str[18:]
+
+    decoded = decode(msgs, data.timestamp, reference=(43.3, 1.35))
+
+    # positions are decoded across batches as in a single call
+    decoder = Decoder(reference=(43.3, 1.35))
+    streamed = []
+    for i in range(0, data.shape[0], 5000):
+        streamed.extend(
+            decoder.decode(msgs[i : i + 5000], data.timestamp[i : i + 5000])
+        )
+
+    assert len(streamed) == len(decoded)
+    assert [msg.get("latitude") for msg in streamed] == [
+        msg.get("latitude") for msg in decoded
+    ]